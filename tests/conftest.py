@@ -0,0 +1,13 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import pytest
+
+from triposo_api.api import Api
+
+
+@pytest.fixture(scope='session')
+def api():
+    """Single Api shared by every test so the connection pool stays warm."""
+    return Api(None, None)
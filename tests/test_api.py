@@ -0,0 +1,101 @@
+import json
+from urllib.parse import urlencode
+
+
+def test_arguments_encoding():
+    def tst(**kwargs):
+        return urlencode(kwargs)
+    url = tst(hello='world', why='not', test='arg')
+    assert url == 'hello=world&why=not&test=arg'
+    url = tst(annotate='trigram:Korea', trigram='>=0.3')
+    assert url == 'annotate=trigram%3AKorea&trigram=%3E%3D0.3'
+
+
+def test_location(api):
+    amsterdam = api.location(id='Amsterdam', fields='all')
+    assert amsterdam is not None
+    assert amsterdam.name is not None
+    assert amsterdam.type is not None
+
+
+def test_find_country(api):
+    koreas = api.locations(tag_labels='country', annotate='trigram:Korea', trigram='>=0.3',
+                           count=10, fields='id,name,score,snippet', order_by='-score')
+    assert koreas is not None
+    assert koreas[0].name is not None
+    assert koreas[1].name is not None
+
+
+def test_day_planner(api):
+    lisbon = api.day_planner(location_id='Lisbon', hotel_poi_id='T__4b30a4f2881c', start_date='2017-06-03',
+                             arrival_time='14:33', end_date='2017-06-06', departure_time='16:55')
+    assert lisbon is not None
+    assert lisbon.location is not None
+    assert lisbon.hotel is not None
+    assert len(lisbon.day) != 0
+
+
+def test_point_of_interest(api):
+    poi = api.point_of_interest(id='W__5013364', fields='all')
+    assert poi is not None
+    assert poi.location_id == "Paris"
+    assert 'sightseeing' in poi.tag_labels
+
+
+def test_points_of_interest_tokyo(api):
+    pois = api.points_of_interest(location_id='Tokyo', annotate='trigram:gold', trigram='>=0.3',
+                                  count=10, fields='id,name,score,snippet,location_id,tag_labels',
+                                  order_by='-score')
+
+    assert pois is not None
+    assert len(pois) == 2
+    assert pois[0].name == 'Golf 5'
+    assert pois[1].name == 'GOLD FOUNTAIN'
+
+
+def test_points_of_interest_paris(api):
+    pois = api.points_of_interest(annotate='trigram:Eiffel', trigram='>=0.3', location_id='Paris',
+                                  count=10, fields='id,name,score,snippet,location_id,tag_labels',
+                                  order_by='-score')
+
+    assert pois is not None
+    assert len(pois) == 10
+
+
+def test_tag_sydney(api):
+    tags = api.tags(location_id='Sydney',
+                    count=10,
+                    order_by='-score')
+    assert tags is not None
+    assert len(tags) == 10
+
+
+def test_architecture_tags(api):
+    architecture = api.tags(location_id='Berlin',
+                            type='architecture')
+    assert architecture is not None
+    assert len(architecture) == 10
+
+
+def test_practical_tags(api):
+    practicals = api.tags(location_id='Saint_Petersburg',
+                          type='practical')
+
+    assert practicals is not None
+    assert len(practicals) == 10
+
+
+def test_batch(api):
+    amsterdam, tags = api.batch(
+        lambda: api.location(id='Amsterdam', fields='all'),
+        lambda: api.tags(location_id='Sydney', count=10, order_by='-score'))
+    assert amsterdam is not None
+    assert amsterdam.name is not None
+    assert tags is not None
+    assert len(tags) == 10
+
+
+def test_get_common_tag_labels(api):
+    tag_labels = api.get_common_tag_labels()
+    with open('tags.txt', 'w') as outfile:
+        json.dump(tag_labels, outfile)
@@ -1,197 +1,333 @@
-"""Module containing the interface to the Api.
-
-Currently access:
-Location
-PointOfInterest
-DayPlan
-Itinerary
-
-"""
-
-import posixpath
-from functools import wraps
-
-from cache_requests import Session
-import requests
-from triposo_api import models, config
-
-class Api(object):
-    """Main class of the API.
-
-    Create an instance of this to access the api.
-
-    """
-
-    def __init__(self, account_id = config.API_ACCOUNT, token = config.API_KEY):
-        """Create an api object.
-
-        Args:
-            api_key (str, optional): api key to use.
-                If one is not supplied, a default one will be generated and used.
-
-        """
-        self.__session = Session()
-        self.__session.headers['X-Triposo-Account'] = account_id
-        self.__session.headers['X-Triposo-Token'] = token
-
-    def __get_data(self, url, params=None):
-        """Get the data at the given URL, using supplied parameters.
-
-        Args:
-            url (str):               The URL to retrieve data from.
-            params (dict, optional): Key-value pairs to include when making the request.
-
-        Returns:
-            json: The JSON response.
-
-        """
-        response = self.__session.get(url, params=params)
-        # Check status code
-        if response.status_code == 401:
-            # TODO Bad api key
-            response.raise_for_status()
-        elif response.status_code == 404:
-            # Api Item does not exist
-            return None
-        elif response.status_code != requests.codes.ok:
-            response.raise_for_status()
-        try:
-            json_data = response.json()
-            # print(json_data)
-            if json_data['estimated_total'] == 1:
-                # print("A single one")
-                return json_data['results'][0]
-            else:
-                # print("Multiple responses")
-                return json_data['results']
-        except ValueError:
-            # Parsing json response failed
-            pass
-
-    def _arguments_from_kwargs(self, arguments):
-        url = ''
-        for key in arguments:
-            url += key + '=' + str(arguments[key]) + '&'
-        url = url.rstrip('&')
-        return url
-
-    def __build_response(self, path, model_class):
-        """Retrieve data from given path and load it into an object of given model class.
-
-        Args:
-            path (str):         Path of API to send request to.
-            model_class (type): The type of pbject to build using the response from the API.
-
-        Returns:
-            object: Instance of the specified model class.
-
-        """
-        data = self.__get_data(posixpath.join(config.END_POINT, path))
-        if not data:
-            # TODO raise exception complaining that no data was retrieved from api?
-            return None
-        return model_class(data, self)
-
-    def __get_multiple(self, path, model_class):
-        """Retrieve from API endpoint that returns a list of items.
-
-        Args:
-            model (type): The type of object to build using the response from the API.
-            path (str):   The path of API to send request to.
-
-        Returns:
-            list: A list containing items of type model_class.
-
-        """
-        url = posixpath.join(config.END_POINT, path)
-        data = self.__get_data(url)
-        if not data:
-            return None
-        items = []
-        # print(data)
-        for json_item in data:
-            item = model_class(json_item, self)
-            items.append(item)
-        return items
-
-    def location(self, **kwargs):
-        """Retrieve the episode corresponding to the specified id.
-
-        Args:
-            location_id (int): ID of the location to retrieve.
-
-        Returns:
-            Location: Location instance.
-
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__build_response('location.json?' + url, models.Location)
-
-    def locations(self, **kwargs):
-        """Get a list of locations.
-
-        Args:
-            kwargs:     Collection of arguments for locations
-
-        Returns:
-            iterable: An iterable collection of :class:`Locations <triposo_api.models.Location>`.
-
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__get_multiple('location.json?' + url, models.Location)
-
-    def day_planner(self, **kwargs):
-        """Get day plans
-
-        Args:
-            kwargs:     Collection of arguments for locations
-
-        Returns:
-            iterable: An iterabile collection of :class:`
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__build_response('day_planner.json?' + url, models.DayPlan)
-
-    def point_of_interest(self, **kwargs):
-        """Get single point of interest
-
-        Args:
-            kwargs:     Collection of arguments for poi
-
-        Returns:
-            POI:    A PointOfInterest class object
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__build_response('poi.json?' + url, models.PointOfInterest)
-
-    def points_of_interest(self, **kwargs):
-        """Get list of points of interest.
-
-        Args:
-            kwargs:     Collection of arguments for poi
-
-        Returns:
-            list(POI):  A list of PointOfInterest objects
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__get_multiple('poi.json?' + url, models.PointOfInterest)
-
-    def tags(self, **kwargs):
-        """Get list of tags.
-
-        Args:
-            kwargs:     Collection of arguments for tags.
-
-        Returns:
-            list(Tag):  A list of Tag objects
-        """
-        url = self._arguments_from_kwargs(kwargs)
-        return self.__get_multiple('tag.json?' + url, models.Tag)
-
-    def get_common_tag_labels(self):
-        """Get list of the most common tags.
-
-        Returns:
-            list(Object):   A list of objects
-        """
-        return self.__get_data(posixpath.join(config.END_POINT, 'common_tag_labels.json'))
\ No newline at end of file
+"""Module containing the interface to the Api.
+
+Currently access:
+Location
+PointOfInterest
+DayPlan
+Itinerary
+
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+
+import requests
+from triposo_api import models, config
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # urllib3 only decodes 'br' bodies when a brotli implementation is importable
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+class Api(object):
+    """Main class of the API.
+
+    Create an instance of this to access the api.
+
+    """
+
+    # Endpoint URLs are fixed per process, so build them once instead of on
+    # every call.
+    _BASE = config.END_POINT.rstrip('/') + '/'
+    _URL_LOCATION = _BASE + 'location.json'
+    _URL_DAY_PLANNER = _BASE + 'day_planner.json'
+    _URL_POI = _BASE + 'poi.json'
+    _URL_TAG = _BASE + 'tag.json'
+    _URL_COMMON_TAG_LABELS = _BASE + 'common_tag_labels.json'
+
+    # (connect, read) timeout so a stalled server cannot hang a pool slot
+    _DEFAULT_TIMEOUT = (3.05, 10)
+
+    # requests.codes.ok, bound once so the hot path is one integer compare
+    _OK = 200
+
+    def __init__(self, account_id = config.API_ACCOUNT, token = config.API_KEY,
+                 timeout = _DEFAULT_TIMEOUT):
+        """Create an api object.
+
+        Args:
+            api_key (str, optional): api key to use.
+                If one is not supplied, a default one will be generated and used.
+            timeout (tuple, optional): (connect, read) timeout in seconds
+                applied to every request.
+
+        """
+        self.__timeout = timeout
+        self.__account_id = account_id
+        self.__token = token
+        # Parsed responses keyed by (url, params), revalidated with ETags.
+        self.__cache = {}
+        # Per-process memo for the rarely-changing common tag labels
+        self.__tag_labels = None
+
+    @cached_property
+    def _session(self):
+        """Build the HTTP session on first use.
+
+        Constructing the session (and importing its dependencies) is deferred
+        so that creating an Api object stays cheap until a request is made.
+
+        Returns:
+            Session: The configured session.
+
+        """
+        from requests.adapters import HTTPAdapter
+        from requests_cache import CachedSession
+        from urllib3.util.retry import Retry
+        # Unlike cache_requests, CachedSession honours server Cache-Control
+        # headers and persists across processes without needing Redis.
+        session = CachedSession('triposo_cache', backend='sqlite',
+                                cache_control=True, expire_after=3600,
+                                stale_if_error=True)
+        session.headers['X-Triposo-Account'] = self.__account_id
+        session.headers['X-Triposo-Token'] = self.__token
+        session.headers['Accept-Encoding'] = ACCEPT_ENCODING
+        # The api only ever talks to one host, so keep a generous pool of
+        # keep-alive connections to it instead of the default ten.
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.2,
+                                                status_forcelist=(500, 502, 503, 504),
+                                                allowed_methods=frozenset(['GET'])))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @cached_property
+    def _request_template(self):
+        """Prepared GET request with the session headers already merged.
+
+        Copying this template and re-preparing only the URL skips the
+        per-call request building that ``session.get`` repeats every time.
+
+        Returns:
+            PreparedRequest: The reusable request template.
+
+        """
+        return self._session.prepare_request(requests.Request('GET', config.END_POINT))
+
+    def __get_data(self, url, params=None):
+        """Get the data at the given URL, using supplied parameters.
+
+        Args:
+            url (str):               The URL to retrieve data from.
+            params (dict, optional): Key-value pairs to include when making the request.
+
+        Returns:
+            list: The results list from the JSON response.
+
+        """
+        cache_key = (url, frozenset(params.items()) if params else None)
+        cached = self.__cache.get(cache_key)
+        request = self._request_template.copy()
+        request.prepare_url(url, params)
+        if cached:
+            request.headers['If-None-Match'] = cached[0]
+        response = self._session.send(request, timeout=self.__timeout)
+        # Check status code, successful request first
+        status = response.status_code
+        if status != self._OK:
+            if status == 304:
+                # Not modified since we last saw it; reuse the parsed result
+                return cached[1]
+            elif status == 404:
+                # Api Item does not exist
+                return None
+            # Bad api key (401) and everything else raise
+            response.raise_for_status()
+            return None
+        try:
+            # orjson parses the raw bytes much faster than the stdlib parser
+            # behind response.json(); its JSONDecodeError is a ValueError.
+            if orjson is not None:
+                json_data = orjson.loads(response.content)
+            else:
+                json_data = response.json()
+            # Always hand back the results list; callers that expect a
+            # single item take the first element themselves.
+            result = json_data['results']
+            etag = response.headers.get('ETag')
+            if etag:
+                self.__cache[cache_key] = (etag, result)
+            return result
+        except ValueError:
+            # Parsing json response failed
+            pass
+
+    def __build_response(self, url, model_class, params=None):
+        """Retrieve data from given URL and load it into an object of given model class.
+
+        Args:
+            url (str):               Full URL of API to send request to.
+            model_class (type):      The type of pbject to build using the response from the API.
+            params (dict, optional): Key-value pairs to include when making the request.
+
+        Returns:
+            object: Instance of the specified model class.
+
+        """
+        data = self.__get_data(url, params)
+        if not data:
+            # TODO raise exception complaining that no data was retrieved from api?
+            return None
+        return model_class(data[0], self)
+
+    def __get_multiple(self, url, model_class, params=None):
+        """Retrieve from API endpoint that returns a list of items.
+
+        Args:
+            model (type):            The type of object to build using the response from the API.
+            url (str):               Full URL of API to send request to.
+            params (dict, optional): Key-value pairs to include when making the request.
+
+        Returns:
+            list: A list containing items of type model_class.
+
+        """
+        data = self.__get_data(url, params)
+        if not data:
+            return None
+        return model_class.from_json_batch(data, self)
+
+    def location(self, **kwargs):
+        """Retrieve the episode corresponding to the specified id.
+
+        Args:
+            location_id (int): ID of the location to retrieve.
+
+        Returns:
+            Location: Location instance.
+
+        """
+        return self.__build_response(self._URL_LOCATION, models.Location, params=kwargs)
+
+    def locations(self, **kwargs):
+        """Get a list of locations.
+
+        Args:
+            kwargs:     Collection of arguments for locations
+
+        Returns:
+            iterable: An iterable collection of :class:`Locations <triposo_api.models.Location>`.
+
+        """
+        return self.__get_multiple(self._URL_LOCATION, models.Location, params=kwargs)
+
+    def locations_bulk(self, kwargs_list, max_workers=8):
+        """Run several location queries concurrently.
+
+        Args:
+            kwargs_list (list):          One kwargs dict per :meth:`locations` call.
+            max_workers (int, optional): Upper bound on concurrent requests.
+
+        Returns:
+            list: One :meth:`locations` result per query, in the order given.
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(lambda kw: self.locations(**kw), kwargs_list))
+
+    def day_planner(self, **kwargs):
+        """Get day plans
+
+        Args:
+            kwargs:     Collection of arguments for locations
+
+        Returns:
+            iterable: An iterabile collection of :class:`
+        """
+        return self.__build_response(self._URL_DAY_PLANNER, models.DayPlan, params=kwargs)
+
+    def point_of_interest(self, **kwargs):
+        """Get single point of interest
+
+        Args:
+            kwargs:     Collection of arguments for poi
+
+        Returns:
+            POI:    A PointOfInterest class object
+        """
+        return self.__build_response(self._URL_POI, models.PointOfInterest, params=kwargs)
+
+    def points_of_interest(self, **kwargs):
+        """Get list of points of interest.
+
+        Args:
+            kwargs:     Collection of arguments for poi
+
+        Returns:
+            list(POI):  A list of PointOfInterest objects
+        """
+        return self.__get_multiple(self._URL_POI, models.PointOfInterest, params=kwargs)
+
+    def tags(self, **kwargs):
+        """Get list of tags.
+
+        Args:
+            kwargs:     Collection of arguments for tags.
+
+        Returns:
+            list(Tag):  A list of Tag objects
+        """
+        return self.__get_multiple(self._URL_TAG, models.Tag, params=kwargs)
+
+    def batch(self, *calls):
+        """Run several independent api calls concurrently.
+
+        The session's connection pool is shared between the workers, so the
+        calls overlap their network round trips instead of queueing up.
+
+        Args:
+            *calls: Zero-argument callables wrapping api calls,
+                e.g. ``lambda: api.location(id='Amsterdam')``.
+
+        Returns:
+            list: The results, in the same order the calls were given.
+
+        """
+        with ThreadPoolExecutor(max_workers=len(calls) or 1) as pool:
+            futures = [pool.submit(call) for call in calls]
+            return [future.result() for future in futures]
+
+    def get_common_tag_labels(self):
+        """Get list of the most common tags.
+
+        The label set is effectively static reference data, so it is kept in
+        a small on-disk cache and only refetched once the cache file is older
+        than :data:`config.TAG_LABELS_TTL`.
+
+        Returns:
+            list(Object):   A list of objects
+        """
+        if self.__tag_labels is not None:
+            return self.__tag_labels
+        cache_path = config.TAG_LABELS_CACHE
+        try:
+            if time.time() - os.path.getmtime(cache_path) < config.TAG_LABELS_TTL:
+                with open(cache_path, 'rb') as infile:
+                    raw = infile.read()
+                self.__tag_labels = (orjson.loads(raw) if orjson is not None
+                                     else json.loads(raw))
+                return self.__tag_labels
+        except (OSError, ValueError):
+            # Missing, expired or unreadable cache; fall through to the api
+            pass
+        data = self.__get_data(self._URL_COMMON_TAG_LABELS)
+        if data:
+            self.__tag_labels = data
+            try:
+                with open(cache_path, 'wb') as outfile:
+                    outfile.write(orjson.dumps(data) if orjson is not None
+                                  else json.dumps(data).encode())
+            except OSError:
+                pass
+        return data
\ No newline at end of file
@@ -1,4 +1,7 @@
 # PUT TOKEN HERE
 END_POINT = 'https://www.triposo.com/api/03/'
 API_ACCOUNT = 'YOUR_ACCOUNT'
-API_KEY = 'YOUR_KEY'
\ No newline at end of file
+API_KEY = 'YOUR_KEY'
+# On-disk cache for the common tag label reference data
+TAG_LABELS_CACHE = '.triposo_tag_labels.json'
+TAG_LABELS_TTL = 24 * 60 * 60
@@ -1,306 +1,537 @@
-"""Module containing the models used for the API.
-
-The classes here can be used independently of the API.
-
-When instantiating an :class:`Episode`, :class:`Show`, :class:`Season`, or :class:`User`
-the ``api`` parameter is optional.
-If it is specified, that object will be used to make calls to the
-API when needed.
-
-For example, :meth:`Episode.season <Episode.season>` would make a call to the API.
-If ``api`` is not specified, ``NotImplementedError`` will be raised if a method that
-needs the api is called.
-
-"""
-
-import os
-from functools import wraps
-
-import requests
-
-
-def api_method(func):
-    """Decorate methods needing access to the api.
-
-    This decorator ensures that methods that need to make a call to the
-    api are only run if access to the api is available.
-    If access to it is not available, ``NotImplementedError`` will be raised.
-
-    """
-    @wraps(func)
-    def api_call(*args, **kwargs):
-        if args[0]._api:
-            return func(*args, **kwargs)
-        else:
-            raise NotImplementedError
-    return api_call
-
-
-class ApiObject(object):
-    """Base class for resources available from the API.
-
-    Resources such as Episodes, Seasons, Shows, and Users should inherit from this class.
-
-    """
-
-    def __init__(self):  # noqa: D102
-        self._thumbnail = {}
-
-    def _build(self, model_json):
-        """Assemble an object from a JSON representation.
-
-        Uses ``self.attrs`` to pull values from ``model_json`` and create object attributes.
-
-        Args:
-            model_json: JSON representation of an API resource.
-
-        Raises:
-            KeyError: if the key from ``self.attrs`` is not a key in ``model_json``
-
-        """
-        for key, value in self.attrs.items():
-            try:
-                # TODO use setattr(self, key, value) instead?
-                self.__dict__.update({key: ApiObject._get_from_dict(model_json, value)})
-            except KeyError:
-                self.__dict__.update({key: None})
-
-    @staticmethod
-    def _get_from_dict(data_dict, map_list):
-        """Retrieve the value corresponding to ``map_list`` in ``data_dict``.
-
-        If ``map_list`` is a string, it is used directly as a key of ``data_dict``.
-        If ``map_list`` is a list or tuple, each item in it is used recusively as a key.
-
-        Args:
-            data_dict (dict): The dictionary to retrieve value from.
-            map_list (list, tuple or str): The key(s) to use in data_dict.
-
-        Returns:
-            The value corresponding to the given key(s).
-
-        """
-        if isinstance(map_list, (list, tuple)):
-            for k in map_list:
-                data_dict = data_dict[k]
-        else:
-            data_dict = data_dict[map_list]
-        return data_dict
-
-    def __eq__(self, other):
-        """Define equality of two API objects as having the same type and attributes."""
-        return (type(self) == type(other) and
-                dict((k, self.__dict__[k]) for k in self.attrs.keys()) ==
-                dict((k, other.__dict__[k]) for k in other.attrs.keys()))
-
-    def __repr__(self):
-        """Nicer printing of API objects."""
-        return str(dict((k, self.__dict__[k]) for k in self.attrs.keys()))
-
-class Location(ApiObject):
-    """Class representing a Location.
-
-    Attributes:
-        id_ (str):              Location identifier.
-        country_id (str):       The location ID of the country this location is contained within.
-        country_code (str):     Agreed upon identifier for countries.
-        intro (str):            Medium-length string describing location.
-        name (str):             The human-readable name of the location.
-        parent_id (str):        The ID of the parent location.
-        score (float):          An indicator of the importance of the location, between 0 and 10.
-        snippet (str):          A short string describing the location.
-        tag_labels (list):      The labels of the tags that apply to this location.
-        type (str):             (city, city_state, island, national_park, region, country).
-    """
-
-    def __init__(self, location_json, api=None):
-        """Take in a JSON representation of a article and convert it into a Article Object.
-
-        Args:
-            article_json (json):       JSON representation of a article resource.
-        """
-        super(Location, self).__init__()
-        self.attrs = {
-            "id_":          "id",
-            "country_id":   "country_id",
-            "country_code": "country_code",
-            "intro":        "intro",
-            "name":         "name",
-            "parent_id":    "parent_id",
-            "score":        "score",
-            "snippet":      "snippet",
-            "tag_labels":   "tag_labels",
-            "type":         "type"
-        }
-        self._build(location_json)
-        self._api = api
-
-class DayPlan(ApiObject):
-    """Class representing a Day Plan.
-
-    Attributes:
-        seed (int):             The seed used to generate this dayplan.
-        location (Location):    Location in which the plan takes place.
-        hotel (POI):            Hotel description where day plan is based from, if supplied
-        days (list):            Day by day description of the day plan.
-    """
-    def __init__(self, dayplan_json, api=None):
-        """Take in a JSON representation of a dayplan and convert it to a DayPlan Object.
-
-        Args:
-            dayplan_json (json):        JSON representation of a article resource.
-        """
-        super(DayPlan, self).__init__()
-        self.attrs = {
-            "seed":         "seed",
-            "_location":    "location",
-            "_hotel":       "hotel",
-            "_days":        "days"
-        }
-        self._build(dayplan_json)
-        self._api = api
-        self.day = []
-        self.location = None
-        self.hotel = None
-        try:
-            self.location = Location(self._location)
-        except:
-            print("Unable to build Location object")
-        try:
-            self.hotel = PointOfInterest(self._hotel)
-        except:
-            print("Unable to build hotel POI")
-        try:
-            for day in self._days:
-                self.day.append(Itinerary(day))
-        except:
-            print("Unable to build itinerary list")
-
-class PointOfInterest(ApiObject):
-    """Class representing a Point of Interest.
-
-    Attributes:
-        id_ (str):              The machine-readable identifier of POI.
-        name (str):             The human-readable name of this POI.
-        price (int):            Price indication for this POI, if available. 1=cheap, 2=medium, 3=expensive.
-        intro (str):            A medium-length version of the content.
-        location_id (str):      The ID of the location this POI is contained within.
-        score (float):          An indicator of the importance of this POI, generally between 0 and 10.
-        snippet (str):          A short version of the content.
-        tag_labels (list):      The labels of the tags that apply to this POI
-    """
-
-    def __init__(self, poi_json, api=None):
-        """Take in a JSON representation of a poi and convert it to a PointOfInterest Object.
-
-        Args:
-            poi_json (json):            JSON representation of a poi resource.
-        """
-        super(PointOfInterest, self).__init__()
-        self.attrs = {
-            "id_":          "id",
-            "name":         "name",
-            "price":        "price_tier",
-            "intro":        "intro",
-            "location_id":  "location_id",
-            "score":        "score",
-            "snippet":      "snippet",
-            "tag_labels":   "tag_labels"
-        }
-        self._build(poi_json)
-        self._api = api
-
-class Itinerary(ApiObject):
-    """Class representing a Itinerary.
-
-    Attributes:
-        date (str):             A title for this itinerary.
-        items (list):           A longer description of this itinerary item.
-    """
-
-    def __init__(self, itinerary_json, api=None):
-        """Take in a JSON representation of a itinerary and convert it to a Itinerary Object.
-
-        Args:
-            itinerary_json (json): JSON representation of an itinerary
-        """
-        super(Itinerary, self).__init__()
-        self.attrs = {
-            "date":         "date",
-            "_items":        "itinerary_items"
-        }
-        self._build(itinerary_json)
-        self._api = api
-        self.items = []
-        try:
-            for item in self._items:
-                self.items.append(ItineraryItem(item))
-        except Exception:
-            print("Oops can't make ItineraryItems.")
-
-class ItineraryItem(ApiObject):
-    """Class representing a Itinerary Item.
-
-    Attributes:
-        title (str):            A title for this itinerary item.
-        description (str):      A longer description of this itinerary item.
-        poi (POI):              The POI object corresponding to this itinerary item.
-    """
-
-    def __init__(self, itinerary_item_json, api=None):
-        """Take in a JSON representation of a itinerary item and convert it to a ItineraryItem Object.
-
-        Args:
-            itinerary_item_json (json): JSON representation of a itinerary item
-        """
-        super(ItineraryItem, self).__init__()
-        self.attrs = {
-            "description":  "description",
-            "title":        "title",
-            "_poi":          "poi"
-        }
-        self._build(itinerary_item_json)
-        self._api = api
-        try:
-            self.poi = PointOfInterest(self._poi)
-        except Exception:
-            print("oops can't make a POI.")
-
-class Tag(ApiObject):
-    """Class representing a Tag Item.
-
-    Attributes:
-        tour_count (int):       The number of tours that have this tag.
-        article_count (int):    The number of articles with this tag.
-        label (str):            A machine-readable label for this tag - only unique within a location_id.
-        location_id (str):      The ID of the location this tag applies to.
-        name (str):             A human-readable name for this tag.
-        poi_count (int):        Number of POIs with this tag.
-        score (int):            The score of this tag, between 0 and ~10.
-        short_name (str):       A short human-readable name for this tag.
-        snippet (str):          A short string describing the tag.
-        tour_count (int):       The number of tours that have this tag.
-        type (tag_type):        The general type of tag.
-    """
-
-    def __init__(self, tag_json, api=None):
-        """Take in a JSON representation of a tag item and convert it to a Tag Object.
-
-        Args:
-            tag_json (json): JSON representation of a tag item
-        """
-        super(Tag, self).__init__()
-        self.attrs = {
-            "tour_count":       "tour_count",
-            "article_count":    "article_count",
-            "label":            "label",
-            "location_id":      "location_id",
-            "name":             "name",
-            "poi_count":        "poi_count",
-            "score":            "score",
-            "short_name":       "short_name",
-            "snippet":          "snippet",
-            "type":             "type"
-        }
-        self._build(tag_json)
+"""Module containing the models used for the API.
+
+The classes here can be used independently of the API.
+
+When instantiating an :class:`Episode`, :class:`Show`, :class:`Season`, or :class:`User`
+the ``api`` parameter is optional.
+If it is specified, that object will be used to make calls to the
+API when needed.
+
+For example, :meth:`Episode.season <Episode.season>` would make a call to the API.
+If ``api`` is not specified, ``NotImplementedError`` will be raised if a method that
+needs the api is called.
+
+"""
+
+import os
+import operator
+import sys
+from functools import reduce
+from types import MappingProxyType
+
+
+def _intern_value(value):
+    """Intern a string (or the strings of a list) so duplicates share storage.
+
+    High-repetition fields such as country codes and tag labels appear
+    thousands of times across a large result set; interning collapses the
+    copies to one object per distinct value.
+
+    Args:
+        value: The freshly parsed JSON value.
+
+    Returns:
+        The value, with any strings interned.
+
+    """
+    if type(value) is str:
+        return sys.intern(value)
+    if type(value) is list:
+        return [sys.intern(item) if type(item) is str else item for item in value]
+    return value
+
+
+def _intern_keys(schema):
+    """Intern a schema's JSON keys so lookups compare against shared strings.
+
+    CPython's dict lookup takes a pointer-equality fast path when the probe
+    key and the stored key are the same object; decoders intern short ASCII
+    keys, so interning ours makes the generated builds hit that path.
+
+    Args:
+        schema (tuple): The (attribute, json key) pairs of a model schema.
+
+    Returns:
+        tuple: The same pairs with every string key interned.
+
+    """
+    return tuple((attr, sys.intern(key) if type(key) is str else key)
+                 for attr, key in schema)
+
+
+# Model schemas, defined once at module level so the class bodies stay short
+# and every key string is interned before the builds are compiled.
+_LOCATION_SCHEMA = _intern_keys((
+    ('id_',            'id'),
+    ('country_id',     'country_id'),
+    ('country_code',   'country_code'),
+    ('intro',          'intro'),
+    ('name',           'name'),
+    ('parent_id',      'parent_id'),
+    ('score',          'score'),
+    ('snippet',        'snippet'),
+    ('tag_labels',     'tag_labels'),
+    ('type',           'type')
+))
+
+_DAY_PLAN_SCHEMA = _intern_keys((
+    ('seed',        'seed'),
+))
+
+_POI_SCHEMA = _intern_keys((
+    ('id_',           'id'),
+    ('name',          'name'),
+    ('price',         'price_tier'),
+    ('intro',         'intro'),
+    ('location_id',   'location_id'),
+    ('score',         'score'),
+    ('snippet',       'snippet'),
+    ('tag_labels',    'tag_labels')
+))
+
+_ITINERARY_SCHEMA = _intern_keys((
+    ('date',     'date'),
+))
+
+_ITINERARY_ITEM_SCHEMA = _intern_keys((
+    ('description',   'description'),
+    ('title',         'title')
+))
+
+_TAG_SCHEMA = _intern_keys((
+    ('tour_count',      'tour_count'),
+    ('article_count',   'article_count'),
+    ('label',           'label'),
+    ('location_id',     'location_id'),
+    ('name',            'name'),
+    ('poi_count',       'poi_count'),
+    ('score',           'score'),
+    ('short_name',      'short_name'),
+    ('snippet',         'snippet'),
+    ('type',            'type')
+))
+
+
+def api_method(func):
+    """Decorate methods needing access to the api.
+
+    This decorator ensures that methods that need to make a call to the
+    api are only run if access to the api is available.
+    If access to it is not available, ``NotImplementedError`` will be raised.
+
+    """
+    def api_call(*args, **kwargs):
+        if args[0]._api:
+            return func(*args, **kwargs)
+        else:
+            raise NotImplementedError
+    # The wrappers are only ever called, never introspected, so copying
+    # just the name is cheaper than functools.wraps
+    api_call.__name__ = func.__name__
+    api_call.__qualname__ = func.__qualname__
+    return api_call
+
+
+class ApiObject(object):
+    """Base class for resources available from the API.
+
+    Resources such as Episodes, Seasons, Shows, and Users should inherit from this class.
+
+    """
+
+    __slots__ = ('_thumbnail', '_api', '_hash')
+
+    # Attributes whose values should be interned when built; overridden by
+    # subclasses with high-repetition string fields.
+    _INTERN = ()
+
+    # Attributes built outside _SCHEMA (nested child objects) that still
+    # take part in equality; overridden by subclasses that construct them.
+    _EQ_EXTRA = ()
+
+    # Shared read-only placeholder so objects without thumbnails do not each
+    # allocate an empty dict; writers replace it with a real mapping.
+    _EMPTY_THUMB = MappingProxyType({})
+
+    def __init__(self):  # noqa: D102
+        self._thumbnail = self._EMPTY_THUMB
+
+    def __init_subclass__(cls, **kwargs):
+        """Compile the schema getters as soon as a model class is defined."""
+        super().__init_subclass__(**kwargs)
+        schema = cls.__dict__.get('_SCHEMA')
+        if schema:
+            cls._extractors = tuple((attr, ApiObject._make_getter(key))
+                                    for attr, key in schema)
+            attrs = [attr for attr, _ in schema]
+            if len(attrs) == 1:
+                # attrgetter with one name returns the bare value; wrap it
+                # so _attr_values always yields a tuple for __eq__/__repr__.
+                getter = operator.attrgetter(attrs[0])
+                cls._attr_values = staticmethod(
+                    lambda obj, _get=getter: (_get(obj),))
+            else:
+                cls._attr_values = operator.attrgetter(*attrs)
+            build = ApiObject._compile_build(cls.__name__, schema,
+                                             frozenset(cls.__dict__.get('_INTERN', ())))
+            if build is not None:
+                cls._build = build
+
+    @staticmethod
+    def _compile_build(class_name, schema, intern_attrs=frozenset()):
+        """Generate a straight-line ``_build`` specialized to ``schema``.
+
+        Emitting one literal-key assignment per field removes the loop,
+        tuple unpacking and getter call from every build. Missing fields
+        are handled with ``dict.get``, which returns None without the cost
+        of raising and catching a KeyError. Schemas with nested key paths
+        are left to the generic :meth:`_build`.
+
+        Args:
+            class_name (str):       Name of the model class, for the qualname.
+            schema (tuple):         The (attribute, json key) pairs to assign.
+            intern_attrs (frozenset, optional): Attributes whose values are
+                run through :func:`_intern_value`.
+
+        Returns:
+            function: The generated ``_build``, or None for nested schemas.
+
+        """
+        if not all(isinstance(key, str) for _, key in schema):
+            return None
+        lines = ['def _build(self, model_json):']
+        lines.append('    get = model_json.get')
+        for attr, key in schema:
+            fetch = 'get({!r})'.format(key)
+            if attr in intern_attrs:
+                fetch = '_intern_value({})'.format(fetch)
+            lines.append('    self.{} = {}'.format(attr, fetch))
+        namespace = {'_intern_value': _intern_value}
+        exec('\n'.join(lines), namespace)
+        build = namespace['_build']
+        build.__qualname__ = class_name + '._build'
+        build.__doc__ = 'Assemble an object from a JSON representation (generated from _SCHEMA).'
+        return build
+
+    @staticmethod
+    def _make_getter(map_list):
+        """Build a callable extracting the value for ``map_list`` from a dict.
+
+        Compiling the lookup once per field moves the isinstance dispatch of
+        :meth:`_get_from_dict` out of the per-instance build loop.
+
+        Args:
+            map_list (list, tuple or str): The key(s) to look up.
+
+        Returns:
+            callable: Getter taking the JSON dict and returning the value.
+
+        """
+        if isinstance(map_list, (list, tuple)):
+            def getter(data_dict, _keys=tuple(map_list)):
+                for k in _keys:
+                    data_dict = data_dict[k]
+                return data_dict
+            return getter
+        return operator.itemgetter(map_list)
+
+    def _build(self, model_json):
+        """Assemble an object from a JSON representation.
+
+        Uses the getters compiled from the class's ``_SCHEMA`` tuple in
+        :meth:`__init_subclass__` to pull values from ``model_json`` and
+        create object attributes.
+
+        Args:
+            model_json: JSON representation of an API resource.
+
+        Raises:
+            KeyError: if a key from ``_SCHEMA`` is not a key in ``model_json``
+
+        """
+        for key, getter in self._extractors:
+            try:
+                setattr(self, key, getter(model_json))
+            except KeyError:
+                setattr(self, key, None)
+
+    @classmethod
+    def from_json_batch(cls, json_items, api=None):
+        """Build many instances at once, skipping per-item ``__init__`` dispatch.
+
+        Instances are allocated with ``__new__`` and filled by :meth:`_build`
+        directly, so bulk construction avoids the constructor call chain per
+        item. Only suitable for models whose ``__init__`` does nothing beyond
+        building; models with post-build wiring such as :class:`DayPlan` must
+        be constructed one by one.
+
+        Args:
+            json_items (list): JSON representations of API resources.
+            api (Api, optional): Api object to use when making calls.
+
+        Returns:
+            list: One instance per JSON item, in order.
+
+        """
+        new = cls.__new__
+        items = []
+        append = items.append
+        for json_item in json_items:
+            obj = new(cls)
+            obj._thumbnail = cls._EMPTY_THUMB
+            obj._api = api
+            obj._build(json_item)
+            append(obj)
+        return items
+
+    @staticmethod
+    def _get_from_dict(data_dict, map_list):
+        """Retrieve the value corresponding to ``map_list`` in ``data_dict``.
+
+        If ``map_list`` is a string, it is used directly as a key of ``data_dict``.
+        If ``map_list`` is a list or tuple, each item in it is used recusively as a key,
+        with the walk run in C by :func:`functools.reduce`.
+
+        Args:
+            data_dict (dict): The dictionary to retrieve value from.
+            map_list (list, tuple or str): The key(s) to use in data_dict.
+
+        Returns:
+            The value corresponding to the given key(s).
+
+        """
+        if isinstance(map_list, (list, tuple)):
+            return reduce(operator.getitem, map_list, data_dict)
+        return data_dict[map_list]
+
+    def __eq__(self, other):
+        """Define equality of two API objects as having the same type and attributes."""
+        if type(self) is not type(other):
+            return False
+        if self._attr_values(self) != other._attr_values(other):
+            return False
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self._EQ_EXTRA)
+
+    def __hash__(self):
+        """Hash on the type and the immutable ``id_`` so objects are set-friendly.
+
+        Defining ``__eq__`` alone left the models unhashable; the hash is
+        computed once and cached in a slot.
+
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((type(self).__name__, getattr(self, 'id_', None)))
+            return self._hash
+
+    def __repr__(self):
+        """Nicer printing of API objects."""
+        return str(dict(zip([attr for attr, _ in self._SCHEMA],
+                            self._attr_values(self))))
+
+class Location(ApiObject):
+    """Class representing a Location.
+
+    Attributes:
+        id_ (str):              Location identifier.
+        country_id (str):       The location ID of the country this location is contained within.
+        country_code (str):     Agreed upon identifier for countries.
+        intro (str):            Medium-length string describing location.
+        name (str):             The human-readable name of the location.
+        parent_id (str):        The ID of the parent location.
+        score (float):          An indicator of the importance of the location, between 0 and 10.
+        snippet (str):          A short string describing the location.
+        tag_labels (list):      The labels of the tags that apply to this location.
+        type (str):             (city, city_state, island, national_park, region, country).
+    """
+
+    __slots__ = ('id_', 'country_id', 'country_code', 'intro', 'name',
+                 'parent_id', 'score', 'snippet', 'tag_labels', 'type')
+
+    _SCHEMA = _LOCATION_SCHEMA
+
+    _INTERN = ('country_id', 'country_code', 'type', 'tag_labels')
+
+    def __init__(self, location_json, api=None):
+        """Take in a JSON representation of a article and convert it into a Article Object.
+
+        Args:
+            article_json (json):       JSON representation of a article resource.
+        """
+        super(Location, self).__init__()
+        self._build(location_json)
+        self._api = api
+
+class DayPlan(ApiObject):
+    """Class representing a Day Plan.
+
+    Attributes:
+        seed (int):             The seed used to generate this dayplan.
+        location (Location):    Location in which the plan takes place.
+        hotel (POI):            Hotel description where day plan is based from, if supplied
+        days (list):            Day by day description of the day plan.
+    """
+    __slots__ = ('seed', '_days', '_day', 'location', 'hotel')
+
+    _SCHEMA = _DAY_PLAN_SCHEMA
+
+    _EQ_EXTRA = ('location', 'hotel', 'day')
+
+    def __init__(self, dayplan_json, api=None):
+        """Take in a JSON representation of a dayplan and convert it to a DayPlan Object.
+
+        Args:
+            dayplan_json (json):        JSON representation of a article resource.
+        """
+        super(DayPlan, self).__init__()
+        self._build(dayplan_json)
+        self._api = api
+        location = dayplan_json.get('location')
+        self.location = Location(location) if location else None
+        hotel = dayplan_json.get('hotel')
+        self.hotel = PointOfInterest(hotel) if hotel else None
+        # Day construction is deferred; building every Itinerary (and its
+        # items and POIs) up front is the expensive part of a plan.
+        self._days = dayplan_json.get('days') or []
+
+    def iter_days(self):
+        """Yield the plan's days one :class:`Itinerary` at a time.
+
+        Callers that only look at the first day (or iterate once) pay for
+        exactly the days they consume instead of the whole plan.
+
+        Yields:
+            Itinerary: The next day of the plan.
+
+        """
+        for day in self._days:
+            yield Itinerary(day)
+
+    @property
+    def day(self):
+        """list: Every day of the plan, built on first access and cached."""
+        try:
+            return self._day
+        except AttributeError:
+            self._day = list(self.iter_days())
+            return self._day
+
+class PointOfInterest(ApiObject):
+    """Class representing a Point of Interest.
+
+    Attributes:
+        id_ (str):              The machine-readable identifier of POI.
+        name (str):             The human-readable name of this POI.
+        price (int):            Price indication for this POI, if available. 1=cheap, 2=medium, 3=expensive.
+        intro (str):            A medium-length version of the content.
+        location_id (str):      The ID of the location this POI is contained within.
+        score (float):          An indicator of the importance of this POI, generally between 0 and 10.
+        snippet (str):          A short version of the content.
+        tag_labels (list):      The labels of the tags that apply to this POI
+    """
+
+    __slots__ = ('id_', 'name', 'price', 'intro', 'location_id', 'score',
+                 'snippet', 'tag_labels')
+
+    _SCHEMA = _POI_SCHEMA
+
+    _INTERN = ('location_id', 'tag_labels')
+
+    def __init__(self, poi_json, api=None):
+        """Take in a JSON representation of a poi and convert it to a PointOfInterest Object.
+
+        Args:
+            poi_json (json):            JSON representation of a poi resource.
+        """
+        super(PointOfInterest, self).__init__()
+        self._build(poi_json)
+        self._api = api
+
+class Itinerary(ApiObject):
+    """Class representing a Itinerary.
+
+    Attributes:
+        date (str):             A title for this itinerary.
+        items (list):           A longer description of this itinerary item.
+    """
+
+    __slots__ = ('date', 'items')
+
+    _SCHEMA = _ITINERARY_SCHEMA
+
+    _EQ_EXTRA = ('items',)
+
+    def __init__(self, itinerary_json, api=None):
+        """Take in a JSON representation of a itinerary and convert it to a Itinerary Object.
+
+        Args:
+            itinerary_json (json): JSON representation of an itinerary
+        """
+        super(Itinerary, self).__init__()
+        self._build(itinerary_json)
+        self._api = api
+        items = itinerary_json.get('itinerary_items')
+        self.items = [ItineraryItem(item) for item in items] if items else []
+
+class ItineraryItem(ApiObject):
+    """Class representing a Itinerary Item.
+
+    Attributes:
+        title (str):            A title for this itinerary item.
+        description (str):      A longer description of this itinerary item.
+        poi (POI):              The POI object corresponding to this itinerary item.
+    """
+
+    __slots__ = ('description', 'title', 'poi')
+
+    _SCHEMA = _ITINERARY_ITEM_SCHEMA
+
+    _EQ_EXTRA = ('poi',)
+
+    def __init__(self, itinerary_item_json, api=None):
+        """Take in a JSON representation of a itinerary item and convert it to a ItineraryItem Object.
+
+        Args:
+            itinerary_item_json (json): JSON representation of a itinerary item
+        """
+        super(ItineraryItem, self).__init__()
+        self._build(itinerary_item_json)
+        self._api = api
+        poi = itinerary_item_json.get('poi')
+        self.poi = PointOfInterest(poi) if poi else None
+
+class Tag(ApiObject):
+    """Class representing a Tag Item.
+
+    Attributes:
+        tour_count (int):       The number of tours that have this tag.
+        article_count (int):    The number of articles with this tag.
+        label (str):            A machine-readable label for this tag - only unique within a location_id.
+        location_id (str):      The ID of the location this tag applies to.
+        name (str):             A human-readable name for this tag.
+        poi_count (int):        Number of POIs with this tag.
+        score (int):            The score of this tag, between 0 and ~10.
+        short_name (str):       A short human-readable name for this tag.
+        snippet (str):          A short string describing the tag.
+        tour_count (int):       The number of tours that have this tag.
+        type (tag_type):        The general type of tag.
+    """
+
+    __slots__ = ('tour_count', 'article_count', 'label', 'location_id', 'name',
+                 'poi_count', 'score', 'short_name', 'snippet', 'type')
+
+    _SCHEMA = _TAG_SCHEMA
+
+    _INTERN = ('label', 'location_id', 'type')
+
+    def __init__(self, tag_json, api=None):
+        """Take in a JSON representation of a tag item and convert it to a Tag Object.
+
+        Args:
+            tag_json (json): JSON representation of a tag item
+        """
+        super(Tag, self).__init__()
+        self._build(tag_json)
         self._api = api
\ No newline at end of file